@@ -1,14 +1,41 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
+import plotly.graph_objects as go
 import requests
 from google import genai
 import json
+import hmac
 from st_supabase_connection import SupabaseConnection
 from datetime import date
+from collections import Counter
+from itertools import chain
 
 st.set_page_config(layout="wide")
 
+# Columns fetched from the analytics table (description is only shown in the Explore offers editor)
+ANALYTICS_COLUMNS = [
+    'title', 'company_name', 'company_category', 'activity_section_details', 'location', 'via',
+    'is_salary_mentioned', 'salary', 'annual_min_salary', 'annual_max_salary', 'work_titles_final',
+    'schedule_type', 'posted_at', 'seniority_category', 'found_skills', 'consulting_status',
+    'job_id', 'apply_link_1', 'apply_link_2', 'description',
+]
+
+# Low-cardinality text columns that are filtered, counted and compared on every rerun
+CATEGORICAL_COLUMNS = [
+    'consulting_status', 'schedule_type', 'seniority_category',
+    'company_category', 'activity_section_details', 'company_name',
+]
+
+# Plotly settings shared by every chart: the ranking bars hover per row and are not animated,
+# and no chart needs zoom/pan or the mode bar
+BAR_CHART_LAYOUT = {'transition_duration': 0, 'hovermode': 'y', 'dragmode': False}
+PLOTLY_CONFIG = {'displayModeBar': False}
+
+# Cached helpers receive the loaded offers, or a slice of them, and key them on the load they come from
+# instead of hashing every cell. The token is set by load_data_from_supabase and follows the frame through pandas operations.
+LOADED_DATA_HASH_FUNCS = {pd.DataFrame: lambda df: df.attrs['loaded_at']}
+
 # --- Main Application Logic ---
 def main():
     conn = st.connection("supabase", type=SupabaseConnection)
@@ -90,90 +117,163 @@ def main():
             st.rerun()
 
     # --- Data Loading (Simplified) ---
-    @st.cache_data
+    # A shared resource rather than cache_data: every rerun and session reads the same frame instead
+    # of unpickling its own copy, so it must never be modified in place.
+    # st.cache_data.clear() (logout, preset saves) does not reach it: the offers are the same for every
+    # user, and the one-hour ttl is what picks up the pipeline's new offers.
+    @st.cache_resource(ttl=3600)
     def load_data_from_supabase():
         """Loads the final, clean data from the analytics table."""
         print("Loading data from Supabase...")
-        response = conn.client.table("analytics_job_offers").select("*").execute()
-        df = pd.DataFrame(response.data)
-        if 'found_skills' in df.columns:
-            # Ensure it's treated as a dictionary, replacing None with an empty dict
-            df['found_skills'] = df['found_skills'].apply(lambda x: x if isinstance(x, dict) else {})
+        response = conn.client.table("analytics_job_offers").select(", ".join(ANALYTICS_COLUMNS)).execute()
+        # Passing the column list skips key inference over every record and keeps the schema on an empty response
+        df = pd.DataFrame(response.data, columns=ANALYTICS_COLUMNS)
+        # Ensure it's treated as a dictionary, replacing None with an empty dict
+        df['found_skills'] = [x if isinstance(x, dict) else {} for x in df['found_skills']]
+        # Flattened once here so that scoring is a set intersection per offer
+        df['_all_skills_set'] = [
+            frozenset(skill for skills in skills_by_category.values() for skill in skills)
+            for skills_by_category in df['found_skills']
+        ]
+        # Categorical codes make the filter comparisons and value counts integer operations
+        for col in CATEGORICAL_COLUMNS:
+            df[col] = df[col].astype('category')
+        df.attrs['loaded_at'] = pd.Timestamp.now(tz='UTC').isoformat()
         return df
 
     # --- Match Score Calculation ---
-    def calculate_match_score(row, profile):
-        score = 0
-        if any(title in row['work_titles_final'] for title in profile.get('target_roles', [])):
-            score += 10
-        
-        if 'found_skills' in row and isinstance(row['found_skills'], dict):
-            # 1. Flatten all found skills for the current job into a single set
-            all_job_skills = set()
-            for category_skills in row['found_skills'].values():
-                all_job_skills.update(category_skills)
-
-            # 2. Check if any of the user's preferred skills are in that set
-            for skill in profile.get('my_skills', []):
-                if skill in all_job_skills:
-                    score += 3
-
-        job_info = {row.get('seniority_category'), row.get('consulting_status'), row.get('schedule_type')}
-        if profile.get('all_job_info') and not job_info.isdisjoint(profile.get('all_job_info', [])):
-                score += 5
-
-        company_info = {row.get('company_category'), row.get('activity_section_details')}
-        if profile.get('all_company_info') and not company_info.isdisjoint(profile.get('all_company_info', [])):
-            score += 5
-            
+    def calculate_match_scores(df, profile):
+        """
+        Scores every offer of df against the search profile.
+        Each criterion is one vectorized pass over the whole frame instead of a Python call per row.
+        """
+        scores = np.zeros(len(df), dtype=np.int32)
+
+        target_roles = profile.get('target_roles', [])
+        if target_roles:
+            title_match = df['work_titles_final'].explode().isin(target_roles).groupby(level=0).any()
+            scores += 10 * title_match.reindex(df.index, fill_value=False).to_numpy()
+
+        my_skills = profile.get('my_skills', [])
+        if my_skills:
+            # A skill listed under two categories only counts once
+            my_skills = set(my_skills)
+            scores += 3 * np.fromiter((len(my_skills & skills) for skills in df['_all_skills_set']), dtype=np.int32, count=len(df))
+
+        if profile.get('all_job_info'):
+            job_info_match = df[['seniority_category', 'consulting_status', 'schedule_type']].isin(profile['all_job_info']).any(axis=1)
+            scores += 5 * job_info_match.to_numpy()
+
+        if profile.get('all_company_info'):
+            company_info_match = df[['company_category', 'activity_section_details']].isin(profile['all_company_info']).any(axis=1)
+            scores += 5 * company_info_match.to_numpy()
+
         min_salary_pref = profile.get('min_salary')
         if min_salary_pref and min_salary_pref > 0:
-            if pd.notna(row['annual_min_salary']) and row['annual_min_salary'] >= min_salary_pref:
-                score += 10
-            elif pd.notna(row['annual_max_salary']) and row['annual_max_salary'] >= min_salary_pref:
-                score += 5
-                
-        return score
+            # Missing salaries compare as False
+            min_salary_ok = pd.to_numeric(df['annual_min_salary'], errors='coerce').ge(min_salary_pref).to_numpy()
+            max_salary_ok = pd.to_numeric(df['annual_max_salary'], errors='coerce').ge(min_salary_pref).to_numpy()
+            scores += np.where(min_salary_ok, 10, np.where(max_salary_ok, 5, 0)).astype(np.int32)
+
+        return scores
+
+    @st.cache_data(max_entries=20, hash_funcs=LOADED_DATA_HASH_FUNCS)
+    def compute_match_scores(df, job_ids, profile):
+        """
+        Cached calculate_match_scores.
+        job_ids and profile form the cache key; df is hashed by its load timestamp.
+        """
+        return calculate_match_scores(df, profile)
 
     # --- Plotting Functions ---
-    def plot_seniorites_pie(df_to_plot):
-        seniority_counts = df_to_plot['seniority_category'].value_counts()
+    # The Breakdown charts take precomputed counts (see compute_breakdown_counts) so that
+    # aggregation is cached separately from rendering.
+    def plot_pie(counts, color_map, label_map=None, text_inside=False, max_slices=6):
+        """
+        Plots a pie chart of precomputed counts, colouring each slice by its raw value.
+        Values beyond the largest max_slices - 1 are grouped into a single 'Other' slice.
+        """
+        if len(counts) > max_slices:
+            top_counts = counts.nlargest(max_slices - 1)
+            top_counts.index = top_counts.index.astype(object)
+            other_count = pd.Series({'Other': counts.sum() - top_counts.sum()})
+            # An existing 'Other' value is merged with the grouped tail
+            counts = pd.concat([top_counts, other_count]).groupby(level=0, sort=False).sum()
+        labels = [label_map.get(value, value) for value in counts.index] if label_map else list(counts.index)
+        fig = go.Figure(go.Pie(
+            labels=labels,
+            values=counts.values,
+            marker_colors=[color_map.get(value, 'lightgrey') for value in counts.index]
+        ))
+        if text_inside:
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+
+    def plot_seniorites_pie(seniority_counts):
         color_map = {'Senior/Expert': '#F6FF47', 'Lead/Manager': '#FF6347', 'Not specified': '#3FD655', 'Intern/Apprentice': "#7A8C8D", 'Junior': "#3FCCD6", 'Other': 'blue'}
-        fig = px.pie(values=seniority_counts.values, names=seniority_counts.index, color=seniority_counts.index, color_discrete_map=color_map)
-        st.plotly_chart(fig, use_container_width=True)
+        plot_pie(seniority_counts, color_map)
 
-    def plot_salary_pie(df_to_plot):
-        if df_to_plot['is_salary_mentioned'].dropna().empty:
+    def plot_salary_pie(salary_counts):
+        if salary_counts.empty:
             st.info("No salary data to display for this selection.")
             return
-        salary_counts = df_to_plot['is_salary_mentioned'].value_counts()
         label_map = {True: 'Salary Mentioned', False: 'Salary Not Mentioned'}
         color_map = {True: '#3FD655', False: '#FF6347'}
-        fig = px.pie(salary_counts, values=salary_counts.values, names=salary_counts.index.map(label_map), color=salary_counts.index, color_discrete_map=color_map)
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig, use_container_width=True)
+        plot_pie(salary_counts, color_map, label_map=label_map, text_inside=True)
 
-    def plot_consulting_pie(df_to_plot):
-        if df_to_plot['consulting_status'].dropna().empty:
+    def plot_consulting_pie(consulting_counts):
+        if consulting_counts.empty:
             st.info("No data to display for the consulting distribution with this selection.")
             return
-        consulting_counts = df_to_plot['consulting_status'].value_counts()
         label_map = {'Consulting': 'Consulting', 'Probably consulting': 'Probably consulting', 'Internal position': 'Internal position'}
         color_map = {'Consulting': '#FF6347', 'Probably consulting': '#F6FF47', 'Internal position': '#3FD655'}
-        fig = px.pie(consulting_counts, values=consulting_counts.values, names=consulting_counts.index.map(label_map), color=consulting_counts.index, color_discrete_map=color_map)
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig, use_container_width=True)
+        plot_pie(consulting_counts, color_map, label_map=label_map, text_inside=True)
     
-    def plot_top_keywords_plotly(df_to_plot, column_name, top_n=10, title=""):
-        if column_name not in df_to_plot.columns or df_to_plot[column_name].dropna().empty:
+    def plot_top_keywords_plotly(keyword_counts, top_n=10, title=""):
+        keyword_counts = keyword_counts.drop("Not specified", errors='ignore').nlargest(top_n).sort_values()
+        if keyword_counts.empty:
             st.warning(f"No data to display for '{title}'.")
             return
-        keywords = df_to_plot.explode(column_name)
-        keywords = keywords[keywords[column_name] != "Not specified"]
-        keyword_counts = keywords[column_name].value_counts().nlargest(top_n).sort_values()
-        if not keyword_counts.empty:
-            fig = px.bar(keyword_counts, x=keyword_counts.values, y=keyword_counts.index, orientation='h', labels={'x': "Number of offers", column_name: "Job Title"}, text_auto=True)
-            st.plotly_chart(fig, use_container_width=True)
+        fig = go.Figure(go.Bar(x=keyword_counts.values, y=keyword_counts.index, orientation='h', text=keyword_counts.values))
+        fig.update_layout(xaxis_title="Number of offers", yaxis_title="Job Title", **BAR_CHART_LAYOUT)
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+
+    def plot_counts_bar_chart(plot_df, column_name, title=None, extra_hover_data=None):
+        """
+        Draws the horizontal bar chart shared by the value count charts.
+        plot_df holds one row per bar, with column_name, 'count' and the extra hover columns.
+        """
+        hover_columns = list(extra_hover_data.values()) if extra_hover_data else []
+        
+        # Build the trace directly: plotly.express would re-inspect the DataFrame on every call
+        fig = go.Figure(go.Bar(
+            x=plot_df['count'],
+            y=plot_df[column_name].astype(str),
+            orientation='h',
+            text=plot_df['count'],
+            customdata=plot_df[hover_columns].to_numpy() if hover_columns else None
+        ))
+        
+        # --- Dynamic Hover Template ---
+        # Start with the basic template
+        hovertemplate = f"<b>{column_name.title()}:</b> %{{y}}<br><b>Count:</b> %{{x}}"
+        
+        # Add extra data fields to the template
+        if extra_hover_data:
+            for i, (label, col_name) in enumerate(extra_hover_data.items()):
+                hovertemplate += f"<br><b>{label}:</b> %{{customdata[{i}]}}"
+            
+        fig.update_traces(hovertemplate=hovertemplate + "<extra></extra>")
+        fig.update_layout(
+            title=title if title else None,
+            xaxis_title='count',
+            yaxis_title=column_name.replace('_', ' ').title(),
+            yaxis={'categoryorder':'total ascending'},
+            **BAR_CHART_LAYOUT
+        )
+        if not title:
+            fig.update_layout(margin=dict(t=20))
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
 
     def plot_value_counts_plotly(df_to_plot, column_name, top_n=10, title=None, extra_hover_data=None):
         """
@@ -193,7 +293,7 @@ def main():
         if extra_hover_data:
             # For each value in column_name, get the first corresponding value from the hover columns
             hover_agg_dict = {col: 'first' for col in extra_hover_data.values()}
-            hover_df = df_to_plot.groupby(column_name).agg(hover_agg_dict).reset_index()
+            hover_df = df_to_plot.groupby(column_name, observed=True).agg(hover_agg_dict).reset_index()
             
             # Merge the counts with the hover data
             plot_df = pd.merge(value_counts, hover_df, on=column_name)
@@ -202,35 +302,20 @@ def main():
             
         # 3. Get the top N results and sort for plotting
         plot_df = plot_df.nlargest(top_n, 'count').sort_values(by='count')
+        plot_counts_bar_chart(plot_df, column_name, title=title, extra_hover_data=extra_hover_data)
 
-        # --- Plotting Logic ---
-        hover_columns = list(extra_hover_data.values()) if extra_hover_data else []
-        
-        fig = px.bar(
-            plot_df,
-            x='count',
-            y=column_name,
-            labels={'count':'count', column_name:column_name.replace('_', ' ').title()},
-            orientation='h',
-            title=title if title else None, 
-            text='count',
-            hover_data=hover_columns
-        )
-        
-        # --- Dynamic Hover Template ---
-        # Start with the basic template
-        hovertemplate = f"<b>{column_name.title()}:</b> %{{y}}<br><b>Count:</b> %{{x}}"
-        
-        # Add extra data fields to the template
-        if extra_hover_data:
-            for i, (label, col_name) in enumerate(extra_hover_data.items()):
-                hovertemplate += f"<br><b>{label}:</b> %{{customdata[{i}]}}"
-            
-        fig.update_traces(hovertemplate=hovertemplate)
-        fig.update_layout(yaxis={'categoryorder':'total ascending'})
-        if not title:
-            fig.update_layout(margin=dict(t=20))
-        st.plotly_chart(fig, use_container_width=True)
+    def plot_precomputed_counts_plotly(value_counts, column_name, top_n=10, title=None):
+        """
+        Plots a bar chart of value counts that were already computed, e.g. by compute_breakdown_counts.
+        """
+        # Categorical columns also count absent categories
+        value_counts = value_counts[value_counts > 0]
+        if value_counts.empty:
+            st.warning(f"No data to display for this chart.")
+            return
+
+        plot_df = value_counts.nlargest(top_n).sort_values().rename_axis(column_name).reset_index(name='count')
+        plot_counts_bar_chart(plot_df, column_name, title=title)
 
     # --- Helper functions to load presets ---
     @st.cache_data(ttl=300)
@@ -263,6 +348,18 @@ def main():
             return response.data.get("search_scores")
         return None
     
+    @st.cache_data(ttl=60, show_spinner=False)
+    def load_tracker(user_id):
+        """Fetches the application tracker rows of a given user, indexed by job_id and with parsed contact dates."""
+        tracker_columns = ['job_id', 'status', 'contact_date', 'notes']
+        tracker_df = pd.DataFrame(columns=tracker_columns)
+        if user_id:
+            response = conn.client.table("tracker").select(", ".join(tracker_columns)).eq("user_id", user_id).execute()
+            if response.data:
+                tracker_df = pd.DataFrame(response.data, columns=tracker_columns)
+                tracker_df['contact_date'] = pd.to_datetime(tracker_df['contact_date']).dt.date
+        return tracker_df.set_index('job_id')
+
     @st.cache_data(ttl=300)
     def load_user_skill_config(user_id):
         """Fetches the search_skills JSON object for a specific user."""
@@ -294,6 +391,76 @@ def main():
                     "aliases_string": ", ".join(alias_list)
                 })
         return pd.DataFrame(lookup_list)
+
+    # --- Cached option lists for the filter widgets ---
+    # source_df is hashed by its load token (see LOADED_DATA_HASH_FUNCS), so the column name and the
+    # data load are the key. max_entries bounds the per-column copies kept.
+    @st.cache_data(max_entries=32, hash_funcs=LOADED_DATA_HASH_FUNCS)
+    def get_unique_values(df, column_name):
+        """Returns the sorted distinct values of a column."""
+        column = df[column_name]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            # The loader built the categories from the loaded values, so they are already the distinct non-null values
+            return sorted(column.cat.categories.tolist())
+        return sorted(column.dropna().unique().tolist())
+
+    @st.cache_data(max_entries=32, hash_funcs=LOADED_DATA_HASH_FUNCS)
+    def get_exploded_column(df, column_name):
+        """Flattens a list column into one value per row, keeping the original row labels."""
+        return df[column_name].explode().dropna()
+
+    @st.cache_data(max_entries=32, hash_funcs=LOADED_DATA_HASH_FUNCS)
+    def get_skills_long(df):
+        """Flattens found_skills into one (category, skill) row per match, keeping the original row labels."""
+        records = [
+            (row_label, category, skill)
+            for row_label, skills_by_category in zip(df.index, df['found_skills'])
+            for category, skills in skills_by_category.items()
+            for skill in skills
+        ]
+        return pd.DataFrame(records, columns=['row', 'category', 'skill']).set_index('row')
+
+    @st.cache_data(max_entries=32, hash_funcs=LOADED_DATA_HASH_FUNCS)
+    def get_unique_list_values(df, column_name):
+        """Returns the sorted distinct values of a list column."""
+        # A single pass over the lists; the exploded Series is only needed by the title filter
+        return sorted(set(chain.from_iterable(df[column_name])))
+    
+    @st.cache_data(max_entries=4, hash_funcs=LOADED_DATA_HASH_FUNCS)
+    def get_profile_options(df):
+        """Returns the option lists of the search profile inputs."""
+        all_skills = sorted(set(get_skills_long(df)['skill']) - {"Not specified"})
+        all_job_info_options = sorted(set(
+            get_unique_values(df, 'seniority_category') + get_unique_values(df, 'consulting_status') + get_unique_values(df, 'schedule_type')
+        ))
+        all_company_info_options = sorted(set(
+            get_unique_values(df, 'company_category') + get_unique_values(df, 'activity_section_details')
+        ))
+        return {
+            'all_skills': all_skills,
+            'all_work_titles': get_unique_list_values(df, 'work_titles_final'),
+            'all_job_info_options': all_job_info_options,
+            'all_company_info_options': all_company_info_options,
+        }
+
+    @st.cache_data(max_entries=50, hash_funcs=LOADED_DATA_HASH_FUNCS)
+    def compute_breakdown_counts(df, filter_key):
+        """
+        Counts the values of every column charted on the Job Offer Breakdown page.
+        filter_key forms the cache key; df is hashed by its load timestamp.
+        """
+        counts = {
+            col: df[col].value_counts()
+            for col in ['seniority_category', 'schedule_type', 'consulting_status', 'company_category',
+                        'company_name', 'activity_section_details']
+        }
+        # Only two numbers are needed for the salary pie: sum the flags instead of hashing them
+        salary_mentioned = df['is_salary_mentioned']
+        counts['is_salary_mentioned'] = pd.Series({True: int(salary_mentioned.eq(True).sum()), False: int(salary_mentioned.eq(False).sum())})
+        # Count the titles straight from the lists instead of materialising an exploded Series
+        counts['work_titles_final'] = pd.Series(Counter(chain.from_iterable(df['work_titles_final'])), dtype='int64')
+        # Categorical columns also count categories absent from the selection
+        return {col: col_counts[col_counts > 0] for col, col_counts in counts.items()}
     
     # --- Initial Data Load ---
     try:
@@ -311,17 +478,18 @@ def main():
     if 'active_filter_preset' not in st.session_state: st.session_state.active_filter_preset = None
     if 'active_search_preset' not in st.session_state: st.session_state.active_search_preset = None
     if 'superuser_access' not in st.session_state: st.session_state.superuser_access = False
+    if 'dirty_job_ids' not in st.session_state: st.session_state.dirty_job_ids = set()
 
     # --- Page Navigation ---
     st.sidebar.header("Navigation")
-    if st.sidebar.button("📄 Job Offer Breakdown", key="nav_breakdown"):
-        st.session_state.page = 'Job Offer Breakdown'
-    if st.sidebar.button("📊 Skills Summary", key="nav_skills"):
-        st.session_state.page = 'Skills Summary'
-    if st.sidebar.button("🔎 Explore Offers", key="nav_data"):
-        st.session_state.page = 'Explore offers'
-    if st.sidebar.button("⚙️ Configure new search", key="nav_superuser"):
-        st.session_state.page = 'Configure new search'
+    # The radio writes the selected page straight into st.session_state.page
+    page_labels = {
+        'Job Offer Breakdown': "📄 Job Offer Breakdown",
+        'Skills Summary': "📊 Skills Summary",
+        'Explore offers': "🔎 Explore Offers",
+        'Configure new search': "⚙️ Configure new search",
+    }
+    st.sidebar.radio("Go to:", options=list(page_labels), format_func=page_labels.get, key='page', label_visibility="collapsed")
 
     # --- Sidebar Filters ---
     st.sidebar.header("Filters")
@@ -376,39 +544,42 @@ def main():
         # No preset is active
         current_values = DEFAULTS
 
-    with st.sidebar.expander("Job Filters"):
-        is_consulting_options = ['Include All'] + sorted(source_df['consulting_status'].dropna().unique().tolist())
-        default_consulting = current_values['consulting'] if current_values['consulting'] in is_consulting_options else 'Include All'
-        selected_is_consulting = st.selectbox('Filter by consulting type:', options=is_consulting_options, index=is_consulting_options.index(default_consulting))
-
-        schedule_type_options = ['All types'] + sorted(source_df['schedule_type'].dropna().unique().tolist())
-        selected_schedule_type = st.selectbox(
-            'Filter by contract type:', options=schedule_type_options,
-            index=schedule_type_options.index(current_values['schedule']) if current_values['schedule'] in schedule_type_options else 0
-        )
+    # The filter widgets are batched in a form so that the page reruns once per Apply, not once per widget change
+    with st.sidebar.form("filters_form"):
+        with st.expander("Job Filters"):
+            is_consulting_options = ['Include All'] + get_unique_values(source_df, 'consulting_status')
+            default_consulting = current_values['consulting'] if current_values['consulting'] in is_consulting_options else 'Include All'
+            selected_is_consulting = st.selectbox('Filter by consulting type:', options=is_consulting_options, index=is_consulting_options.index(default_consulting))
+
+            schedule_type_options = ['All types'] + get_unique_values(source_df, 'schedule_type')
+            selected_schedule_type = st.selectbox(
+                'Filter by contract type:', options=schedule_type_options,
+                index=schedule_type_options.index(current_values['schedule']) if current_values['schedule'] in schedule_type_options else 0
+            )
         
-        seniority_options = sorted(source_df['seniority_category'].unique().tolist())
-        safe_seniority_defaults = [s for s in current_values['seniority_category'] if s in seniority_options]
-        selected_seniority = st.multiselect('Select seniority levels:', options=seniority_options, default=safe_seniority_defaults)
+            seniority_options = get_unique_values(source_df, 'seniority_category')
+            safe_seniority_defaults = [s for s in current_values['seniority_category'] if s in seniority_options]
+            selected_seniority = st.multiselect('Select seniority levels:', options=seniority_options, default=safe_seniority_defaults)
 
-        all_work_titles = sorted(source_df.explode('work_titles_final')['work_titles_final'].dropna().unique().tolist())
-        safe_titles_defaults = [t for t in current_values['titles'] if t in all_work_titles]
-        selected_work_titles = st.multiselect('Select specific job titles:', options=all_work_titles, default=safe_titles_defaults)
+            all_work_titles = get_unique_list_values(source_df, 'work_titles_final')
+            safe_titles_defaults = [t for t in current_values['titles'] if t in all_work_titles]
+            selected_work_titles = st.multiselect('Select specific job titles:', options=all_work_titles, default=safe_titles_defaults)
     
-    with st.sidebar.expander("Company Filters"):
-        category_options = ['All categories'] + sorted(source_df['company_category'].dropna().unique().tolist())
-        selected_category_company = st.multiselect(
-            "Filter by company category:", options=category_options,
-            default=current_values.get('category_company', [])
-        )
-        selected_sector_company = st.selectbox(
-            "Filter by company sector:",
-            options=['All sectors'] + sorted(source_df['activity_section_details'].dropna().unique().tolist())
-        )
-        selected_company = st.selectbox(
-            'Filter by company:',
-            options=['All companies'] + sorted(source_df['company_name'].dropna().unique().tolist())
-        )
+        with st.expander("Company Filters"):
+            category_options = ['All categories'] + get_unique_values(source_df, 'company_category')
+            selected_category_company = st.multiselect(
+                "Filter by company category:", options=category_options,
+                default=current_values.get('category_company', [])
+            )
+            selected_sector_company = st.selectbox(
+                "Filter by company sector:",
+                options=['All sectors'] + get_unique_values(source_df, 'activity_section_details')
+            )
+            selected_company = st.selectbox(
+                'Filter by company:',
+                options=['All companies'] + get_unique_values(source_df, 'company_name')
+            )
+        st.form_submit_button("Apply filters")
 
     # This section now runs AFTER the variables above have been created.
     if session:
@@ -445,24 +616,40 @@ def main():
             else:
                 st.sidebar.warning("Please enter a name for your preset.")
 
+    # Hashable signature of the filter selection, used to key cached aggregates
+    filter_key = (
+        selected_is_consulting, selected_schedule_type, tuple(selected_seniority), tuple(selected_work_titles),
+        tuple(selected_category_company), selected_sector_company, selected_company,
+    )
+
     # --- Filter Application ---
-    df_display = source_df.copy()
-    if selected_is_consulting != 'Include All':
-        df_display = df_display[df_display['consulting_status'] == selected_is_consulting]
-    if selected_sector_company != 'All sectors':
-        df_display = df_display[df_display['activity_section_details'] == selected_sector_company]
-    if selected_category_company:
-        df_display = df_display[df_display['company_category'].isin(selected_category_company)]
-    if selected_company != 'All companies':
-        df_display = df_display[df_display['company_name'] == selected_company]
-    if selected_schedule_type != 'All types':
-        df_display = df_display[df_display['schedule_type'] == selected_schedule_type]
-    if selected_seniority:
-        df_display = df_display[df_display['seniority_category'].isin(selected_seniority)]
-    if selected_work_titles:
-        df_display = df_display[df_display['work_titles_final'].apply(
-            lambda titles_in_row: any(title in titles_in_row for title in selected_work_titles)
-        )]
+    # Reruns that keep the same selection on the same data load (page switches, editor edits) reuse the last slice
+    filtered_offers_key = (source_df.attrs['loaded_at'], filter_key)
+    if st.session_state.get('filtered_offers_key') == filtered_offers_key:
+        df_display = st.session_state.filtered_offers
+    else:
+        # Combine every active filter into a single boolean mask and slice source_df once
+        mask = np.ones(len(source_df), dtype=bool)
+        if selected_is_consulting != 'Include All':
+            mask &= (source_df['consulting_status'] == selected_is_consulting).to_numpy()
+        if selected_sector_company != 'All sectors':
+            mask &= (source_df['activity_section_details'] == selected_sector_company).to_numpy()
+        if selected_category_company:
+            mask &= source_df['company_category'].isin(selected_category_company).to_numpy()
+        if selected_company != 'All companies':
+            mask &= (source_df['company_name'] == selected_company).to_numpy()
+        if selected_schedule_type != 'All types':
+            mask &= (source_df['schedule_type'] == selected_schedule_type).to_numpy()
+        if selected_seniority:
+            mask &= source_df['seniority_category'].isin(selected_seniority).to_numpy()
+        if selected_work_titles:
+            # Look the selected titles up in the cached exploded column instead of scanning each row's list
+            exploded_titles = get_exploded_column(source_df, 'work_titles_final')
+            matching_rows = exploded_titles.index[exploded_titles.isin(selected_work_titles)]
+            mask &= source_df.index.isin(matching_rows)
+        df_display = source_df.loc[mask]
+        st.session_state.filtered_offers_key = filtered_offers_key
+        st.session_state.filtered_offers = df_display
 
     # --- Page Display ---
     if st.session_state.page == 'Skills Summary':
@@ -480,19 +667,13 @@ def main():
         alias_lookup_df = create_alias_lookup_df(user_skill_config)
         user_relevant_categories = user_skill_config.keys() # e.g., ['soft_skills', 'data_visualization_reporting']
         
-        # 3. Aggregate all skills from the 'found_skills' column (this part is the same)
-        all_skills_list = []
-        for index, row in df_display.iterrows():
-            for category, skills in row['found_skills'].items():
-                for skill in skills:
-                    # The category here is the database format (e.g., 'soft_skills')
-                    all_skills_list.append({'category': category, 'skill': skill})
+        # 3. Keep the flattened skills of the filtered offers (the category is in database format, e.g. 'soft_skills')
+        skills_long = get_skills_long(source_df)
+        skills_df = skills_long[skills_long.index.isin(df_display.index)]
         
-        if not all_skills_list:
+        if skills_df.empty:
             st.info("No technical skills were found in the selected job offers.")
         else:
-            skills_df = pd.DataFrame(all_skills_list)
-
             # 4. MERGE the found skills with their aliases
             skills_with_aliases_df = pd.merge(skills_df, alias_lookup_df, on=['category', 'skill'], how='left')
 
@@ -540,37 +721,38 @@ def main():
     elif st.session_state.page == 'Job Offer Breakdown':
         st.title("📄 Job Offer Breakdown")
         st.write(f"Analysis of **{len(df_display)}** filtered job offers.")
+        breakdown_counts = compute_breakdown_counts(df_display, filter_key)
         col1, col2 = st.columns(2)
         with col1:
             st.header("Job Titles")
-            plot_top_keywords_plotly(df_display, 'work_titles_final', top_n=15)
+            plot_top_keywords_plotly(breakdown_counts['work_titles_final'], top_n=15)
         with col2:
             st.header("Seniority Levels")
-            plot_seniorites_pie(df_display)
+            plot_seniorites_pie(breakdown_counts['seniority_category'])
         st.markdown("---") 
         col1, col2 = st.columns(2)
         with col1:
             st.header("Contract Type")
-            plot_value_counts_plotly(df_display, 'schedule_type', top_n=15)
+            plot_precomputed_counts_plotly(breakdown_counts['schedule_type'], 'schedule_type', top_n=15)
         with col2:
             st.header("Consulting")
-            plot_consulting_pie(df_display)
+            plot_consulting_pie(breakdown_counts['consulting_status'])
         st.markdown("---") 
         col1, col2 = st.columns(2)
         with col1:
             st.header("Top Company Categories")
-            plot_value_counts_plotly(df_display, 'company_category', top_n=15)
+            plot_precomputed_counts_plotly(breakdown_counts['company_category'], 'company_category', top_n=15)
         with col2:
             st.header("Salaries")
-            plot_salary_pie(df_display)
+            plot_salary_pie(breakdown_counts['is_salary_mentioned'])
         st.markdown("---") 
         col1, col2 = st.columns(2)
         with col1:
             st.header("Company Analysis")
-            plot_value_counts_plotly(df_display, 'company_name', top_n=15)
+            plot_precomputed_counts_plotly(breakdown_counts['company_name'], 'company_name', top_n=15)
         with col2:
             st.header("Top Activities")
-            plot_value_counts_plotly(df_display, 'activity_section_details', top_n=15)
+            plot_precomputed_counts_plotly(breakdown_counts['activity_section_details'], 'activity_section_details', top_n=15)
         st.markdown("---") 
 
     elif st.session_state.page == 'Explore offers':
@@ -629,18 +811,11 @@ def main():
             else:
                 current_profile_values = PROFILE_DEFAULTS
 
-            combined_skills = set()
-            for skills_dict in source_df['found_skills']:
-                for skill_list in skills_dict.values():
-                    combined_skills.update(skill_list)
-
-            all_skills = sorted(list(combined_skills))
-            if "Not specified" in all_skills:
-                all_skills.remove("Not specified")
-
-            all_work_titles = sorted(source_df.explode('work_titles_final')['work_titles_final'].dropna().unique().tolist())
-            all_job_info_options = sorted(list(set(source_df['seniority_category'].dropna().unique().tolist() + source_df['consulting_status'].dropna().unique().tolist() + source_df['schedule_type'].dropna().unique().tolist())))
-            all_company_info_options = sorted(list(set(source_df['company_category'].dropna().unique().tolist() + source_df['activity_section_details'].dropna().unique().tolist())))
+            profile_options = get_profile_options(source_df)
+            all_skills = profile_options['all_skills']
+            all_work_titles = profile_options['all_work_titles']
+            all_job_info_options = profile_options['all_job_info_options']
+            all_company_info_options = profile_options['all_company_info_options']
 
             safe_skills = [s for s in current_profile_values.get('my_skills', []) if s in all_skills]
             safe_roles = [r for r in current_profile_values.get('target_roles', []) if r in all_work_titles]
@@ -648,39 +823,42 @@ def main():
             safe_company_info = [i for i in current_profile_values.get('all_company_info', []) if i in all_company_info_options]
             default_salary = current_profile_values.get("min_salary")
 
-            # --- ORGANIZED INPUTS ---
-            st.subheader("Personal Preferences")
-            col1, col2 = st.columns(2)
-            with col1:
-                st.session_state.profile['my_skills'] = st.multiselect(
-                    'My Skills (+3 pts/skill):', 
-                    options=all_skills, 
-                    default=safe_skills
+            # Profile edits are batched in a form so that the offers are rescored once per Apply
+            with st.form("profile_form"):
+                # --- ORGANIZED INPUTS ---
+                st.subheader("Personal Preferences")
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.session_state.profile['my_skills'] = st.multiselect(
+                        'My Skills (+3 pts/skill):', 
+                        options=all_skills, 
+                        default=safe_skills
+                    )
+                with col2:
+                    st.session_state.profile['target_roles'] = st.multiselect(
+                        'My Target Roles (+10 pts):', 
+                        options=all_work_titles, 
+                        default=safe_roles
+                    )
+
+                st.subheader("Job Preferences")
+                st.session_state.profile['all_job_info'] = st.multiselect(
+                    'Preferred Job Info (seniority, contract, etc.) (+5 pts):', 
+                    options=all_job_info_options, 
+                    default=safe_job_info
                 )
-            with col2:
-                st.session_state.profile['target_roles'] = st.multiselect(
-                    'My Target Roles (+10 pts):', 
-                    options=all_work_titles, 
-                    default=safe_roles
+                st.session_state.profile['min_salary'] = st.number_input(
+                    'Minimum annual salary in € (+5/10 pts):',
+                    min_value=0, step=1000, value=default_salary or 0
                 )
 
-            st.subheader("Job Preferences")
-            st.session_state.profile['all_job_info'] = st.multiselect(
-                'Preferred Job Info (seniority, contract, etc.) (+5 pts):', 
-                options=all_job_info_options, 
-                default=safe_job_info
-            )
-            st.session_state.profile['min_salary'] = st.number_input(
-                'Minimum annual salary in € (+5/10 pts):',
-                min_value=0, step=1000, value=default_salary or 0
-            )
-
-            st.subheader("Company Preferences")
-            st.session_state.profile['all_company_info'] = st.multiselect(
-                "Preferred Company Info (size, sector) (+5 pts):", 
-                options=all_company_info_options, 
-                default=safe_company_info
-            )
+                st.subheader("Company Preferences")
+                st.session_state.profile['all_company_info'] = st.multiselect(
+                    "Preferred Company Info (size, sector) (+5 pts):", 
+                    options=all_company_info_options, 
+                    default=safe_company_info
+                )
+                st.form_submit_button("Apply profile")
 
             # --- NEW: Save Search Profile button ---
             if session:
@@ -711,57 +889,67 @@ def main():
 
         # --- Apply Date Filtering ---
         # 1. Ensure posted_at is a datetime object (handles dbt strings or timestamps)
-        df_display['posted_at_dt'] = pd.to_datetime(df_display['posted_at'], errors='coerce', utc=True)
+        df_display = df_display.assign(posted_at_dt=pd.to_datetime(df_display['posted_at'], errors='coerce', utc=True))
         
         # 2. Calculate the cutoff date
         cutoff_date = pd.Timestamp.now(tz='UTC') - pd.Timedelta(days=days_limit)
         
         # 3. Filter the dataframe
         # We keep rows that are newer than cutoff OR rows where date is missing (optional)
-        df_display = df_display[df_display['posted_at_dt'] >= cutoff_date].copy()
-
-        # We check if the date is valid (not NaT) and within the threshold
-        df_display['title'] = df_display.apply(
-            lambda row: f"🆕 {row['title']}" 
-            if pd.notnull(row['posted_at_dt']) and row['posted_at_dt'] >= new_threshold 
-            else row['title'], 
-            axis=1
+        # No copy needed: the derived columns below are added with assign, which returns a new frame
+        df_display = df_display[df_display['posted_at_dt'] >= cutoff_date]
+
+        # Flag recent offers in one vectorized pass (NaT dates compare as False)
+        is_new = (df_display['posted_at_dt'] >= new_threshold).to_numpy()
+        # Both derived columns are added in a single assign rather than two block insertions
+        df_display = df_display.assign(
+            title=np.where(is_new, "🆕 " + df_display['title'], df_display['title']),
+            match_score=compute_match_scores(df_display, tuple(df_display['job_id']), st.session_state.profile),
         )
-        
-        df_display['match_score'] = df_display.apply(lambda row: calculate_match_score(row, st.session_state.profile), axis=1)
         st.write(f"Displaying **{len(df_display)}** filtered offers.")
 
-        conn = st.connection("supabase", type=SupabaseConnection)
-        response = conn.client.table("tracker").select("*").execute()
-        tracker_df = pd.DataFrame(response.data)
-        if tracker_df.empty:
-            tracker_df = pd.DataFrame(columns=['job_id', 'status', 'contact_date', 'notes'])
-        if 'contact_date' in tracker_df.columns:
-            tracker_df['contact_date'] = pd.to_datetime(tracker_df['contact_date']).dt.date
-
-        df_display_sorted = df_display.sort_values(by="match_score", ascending=False)
-        df_with_status = pd.merge(df_display_sorted, tracker_df, on="job_id", how="left")
-        df_prepared = df_with_status.copy()
-
-        if 'status' not in df_prepared.columns: df_prepared['status'] = None
-        if 'contact_date' not in df_prepared.columns: df_prepared['contact_date'] = None
-        if 'notes' not in df_prepared.columns: df_prepared['notes'] = None
+        # Only the logged-in user's own rows can be merged below, so filter them server-side.
+        # Look the tracker fields up by job_id instead of merging the whole frames
+        tracker_by_job = load_tracker(session.user.id if session else None)
+        df_prepared = df_display.sort_values(by="match_score", ascending=False, ignore_index=True)
+        df_prepared = df_prepared.assign(**{
+            # object dtype so that the editor can write text and dates into untracked rows
+            col: df_prepared['job_id'].map(tracker_by_job[col]).astype(object)
+            for col in ['status', 'contact_date', 'notes']
+        }, **{
+            # The categories only serve filtering and counting: the editor would send every category
+            # with each page and render these read-only text fields as selectboxes
+            col: df_prepared[col].astype(object)
+            for col in CATEGORICAL_COLUMNS
+        })
         
         desired_order = ['match_score', 'title', 'company_name', 'status', 'contact_date', 'annual_min_salary', 'annual_max_salary']
-        other_columns = [col for col in df_prepared.columns if col not in desired_order]
+        # Helper and nested columns are never edited nor readable in a table cell, keep them out of the editor state
+        excluded_columns = ['posted_at_dt', 'found_skills']
+        other_columns = [
+            col for col in df_prepared.columns
+            if col not in desired_order + excluded_columns and not col.startswith('_')
+        ]
         df_prepared = df_prepared[desired_order + other_columns]
 
         profile_has_changed = st.session_state.get('profile') != st.session_state.get('last_profile')
-        try:
-            current_ids_in_state = set(st.session_state.df_editor_state['job_id'])
-        except (KeyError, AttributeError):
-            current_ids_in_state = set()
-        newly_filtered_ids = set(df_prepared['job_id'])
-        filters_have_changed = current_ids_in_state != newly_filtered_ids
+        # The listed offers change with the sidebar selection, the moving recency cutoff and new loads.
+        # An order-independent digest of their job ids compares them without building sets on every rerun,
+        # and a reload that lists the same offers keeps the unsaved edits
+        listed_job_ids_digest = (len(df_prepared), int(pd.util.hash_pandas_object(df_prepared['job_id'], index=False).sum()))
+        editor_signature = (filter_key, listed_job_ids_digest)
+        filters_have_changed = st.session_state.get('editor_signature') != editor_signature
 
         if 'df_editor_state' not in st.session_state or filters_have_changed or profile_has_changed:
-            st.session_state.df_editor_state = df_prepared.copy()
+            # df_prepared is rebuilt on every rerun, so the state can own it without a copy
+            st.session_state.df_editor_state = df_prepared
             st.session_state.last_profile = st.session_state.profile.copy()
+            st.session_state.editor_signature = editor_signature
+            # Pending edits refer to row positions of the previous table, drop them and go back to the first page
+            for key in [key for key in st.session_state if key.startswith('job_editor')]:
+                del st.session_state[key]
+            st.session_state.pop('editor_page', None)
+            st.session_state.dirty_job_ids = set()
 
         max_possible_score = 10 + 5 + 5
         max_possible_score += (3 * len(st.session_state.profile.get('my_skills', [])))
@@ -769,97 +957,141 @@ def main():
             max_possible_score += 10
         if max_possible_score == 0: max_possible_score = 1
 
-        # Define all available columns and a sensible list of defaults
-        all_columns = df_prepared.columns.tolist()
-        default_columns = [
-            'posted_at', 'match_score', 'title', 'company_name', 'status', 'contact_date', 
-            'annual_min_salary', 'location', 'schedule_type', 'apply_link_1','apply_link_2'
-        ]
+        # --- CONSTANT for the page sizes offered for the editor (offers sent to the browser at once) ---
+        EDITOR_PAGE_SIZE_OPTIONS = [50, 200, 1000]
+        # --- CONSTANT for the number of tracker rows sent per upsert request ---
+        TRACKER_UPSERT_CHUNK_SIZE = 500
+
+        @st.fragment
+        def render_offers_editor(all_columns):
+            """
+            Renders the editable offers table and the save button.
+            Runs as a fragment so that edits and saves only rerun this block, not the whole page.
+            """
+            # Sensible list of default columns
+            default_columns = [
+                'posted_at', 'match_score', 'title', 'company_name', 'status', 'contact_date', 
+                'annual_min_salary', 'location', 'schedule_type', 'apply_link_1','apply_link_2'
+            ]
         
-        # Ensure default columns exist in the DataFrame before using them
-        valid_default_columns = [col for col in default_columns if col in all_columns]
+            # Ensure default columns exist in the DataFrame before using them
+            valid_default_columns = [col for col in default_columns if col in all_columns]
 
-        selected_columns = st.multiselect(
-            "Select columns to display:",
-            options=all_columns,
-            default=valid_default_columns
-        )
+            selected_columns = st.multiselect(
+                "Select columns to display:",
+                options=all_columns,
+                default=valid_default_columns
+            )
 
-        # The data editor now uses the filtered list of columns
-        if not selected_columns:
-            st.warning("Please select at least one column to display.")
+            # The data editor now uses the filtered list of columns
+            if not selected_columns:
+                st.warning("Please select at least one column to display.")
 
-        else:
-            edited_df = st.data_editor(
-                st.session_state.df_editor_state[selected_columns], # Display only selected columns
-                column_config={
-                    "match_score": st.column_config.ProgressColumn(
-                        "Score", help="Relevance score based on your profile",
-                        min_value=0, max_value=max_possible_score, width="small"
-                    ),
-                    "title": st.column_config.Column(pinned=True, width="medium"),
-                    "company_name": st.column_config.Column(pinned=True, width="small"),
-                    "status": st.column_config.SelectboxColumn(
-                        "Status", width="small", options=["📞 Contacted", "❌ Refused", "✅ Positive", "⌛ Expired", "🙅 Not interested"],
-                        required=False, pinned=True,
-                    ),
-                    "contact_date": st.column_config.DateColumn("Contact Date", width="small"),
-                    "annual_min_salary": st.column_config.NumberColumn("Min Salary (€)", format="€%d"),
-                    "annual_max_salary": st.column_config.NumberColumn("Max Salary (€)", format="€%d"),
-                    "apply_link_1": st.column_config.LinkColumn(
-                    "Apply Link 1",
-                    # This regex captures and displays the domain name
-                    display_text=r"https?://(?:www\.)?([^/]+)"
-                    ),
-                    "apply_link_2": st.column_config.LinkColumn(
-                        "Apply Link 2",
+            else:
+                # Only one page of offers is sent to the browser on each rerun
+                size_col, page_col = st.columns(2)
+                page_size = size_col.selectbox(
+                    "Rows per page:", options=EDITOR_PAGE_SIZE_OPTIONS, index=1,
+                    # The current page may not exist at the new size, go back to the first one
+                    on_change=lambda: st.session_state.pop('editor_page', None)
+                )
+                num_pages = max(1, -(-len(st.session_state.df_editor_state) // page_size))
+                page = 1
+                if num_pages > 1:
+                    page = page_col.number_input(f"Page (of {num_pages})", min_value=1, max_value=num_pages, step=1, key='editor_page')
+                page_start = (page - 1) * page_size
+                editor_key = f'job_editor_{page_size}_{page}'
+
+                st.data_editor(
+                    st.session_state.df_editor_state[selected_columns].iloc[page_start:page_start + page_size], # Display only selected columns
+                    column_config={
+                        "match_score": st.column_config.ProgressColumn(
+                            "Score", help="Relevance score based on your profile",
+                            min_value=0, max_value=max_possible_score, width="small"
+                        ),
+                        "title": st.column_config.Column(pinned=True, width="medium"),
+                        "company_name": st.column_config.Column(pinned=True, width="small"),
+                        "status": st.column_config.SelectboxColumn(
+                            "Status", width="small", options=["📞 Contacted", "❌ Refused", "✅ Positive", "⌛ Expired", "🙅 Not interested"],
+                            required=False, pinned=True,
+                        ),
+                        "contact_date": st.column_config.DateColumn("Contact Date", width="small"),
+                        "annual_min_salary": st.column_config.NumberColumn("Min Salary (€)", format="€%d"),
+                        "annual_max_salary": st.column_config.NumberColumn("Max Salary (€)", format="€%d"),
+                        "apply_link_1": st.column_config.LinkColumn(
+                        "Apply Link 1",
+                        # This regex captures and displays the domain name
                         display_text=r"https?://(?:www\.)?([^/]+)"
-                    ),
-                    "job_id": None
-                },
-                hide_index=True, 
-                width='stretch', 
-                key='job_editor'
-            )
+                        ),
+                        "apply_link_2": st.column_config.LinkColumn(
+                            "Apply Link 2",
+                            display_text=r"https?://(?:www\.)?([^/]+)"
+                        ),
+                        "job_id": None
+                    },
+                    hide_index=True, 
+                    width='stretch', 
+                    key=editor_key
+                )
 
-            if not edited_df.equals(st.session_state.df_editor_state[selected_columns]):
-                # Create a copy of the full DataFrame from session state
-                df_updates = st.session_state.df_editor_state.copy()
-
-                # Update the columns that were edited
-                for col in selected_columns:
-                    if col in ['status', 'contact_date', 'notes']: # Only update editable columns
-                        df_updates[col] = edited_df[col]
-
-                for index, row in df_updates.iterrows():
-                    if index in st.session_state.df_editor_state.index:
-                        original_row = st.session_state.df_editor_state.loc[index]
-                        original_status = original_row['status'] if pd.notna(original_row['status']) else ""
-                        current_status = row['status'] if pd.notna(row['status']) else ""
-                        if current_status == "📞 Contacted" and original_status != "📞 Contacted":
-                            df_updates.loc[index, 'contact_date'] = date.today()
-                
-                # Save the fully updated DataFrame back to session state
-                st.session_state.df_editor_state = df_updates.copy()
-                st.rerun()
+                # The editor reports edits sparsely as {row position: {column: new value}},
+                # so only the touched cells are compared and written back
+                edited_rows = st.session_state[editor_key].get('edited_rows', {})
+                editor_state = st.session_state.df_editor_state
+                state_changed = False
+                for page_row, changes in edited_rows.items():
+                    row_position = page_start + int(page_row)
+                    for col, new_value in changes.items():
+                        if col not in ['status', 'contact_date', 'notes']: # Only update editable columns
+                            continue
+                        if col == 'contact_date' and new_value is not None:
+                            new_value = pd.to_datetime(new_value).date()
+                        col_position = editor_state.columns.get_loc(col)
+                        old_value = editor_state.iat[row_position, col_position]
+                        if (pd.isna(old_value) and pd.isna(new_value)) or old_value == new_value:
+                            continue
+                        editor_state.iat[row_position, col_position] = new_value
+                        st.session_state.dirty_job_ids.add(editor_state.iat[row_position, editor_state.columns.get_loc('job_id')])
+                        state_changed = True
+                        if col == 'status' and new_value == "📞 Contacted":
+                            editor_state.iat[row_position, editor_state.columns.get_loc('contact_date')] = date.today()
+
+                if state_changed:
+                    st.rerun(scope="fragment")
+
+            if st.button("Save My Progress to Supabase"):
+                # The session fetched at the top of the run is reused, only its user id is needed here
+                current_user_id = session.user.id if session else None
+                if current_user_id:
+                    # Only the offers edited since the last save are sent
+                    editor_state = st.session_state.df_editor_state
+                    updated_tracker = editor_state.loc[
+                        editor_state['job_id'].isin(st.session_state.dirty_job_ids), ["job_id", "status", "contact_date", "notes"]
+                    ]
+                    updated_tracker = updated_tracker.dropna(subset=['status'])
+                    if updated_tracker.empty:
+                        # Skip the request altogether when no tracked offer was changed
+                        st.info("Nothing to save: no offer status was changed since the last save.")
+                    else:
+                        updated_tracker['user_id'] = current_user_id
+                        if 'contact_date' in updated_tracker.columns:
+                            updated_tracker['contact_date'] = pd.to_datetime(updated_tracker['contact_date']).dt.strftime('%Y-%m-%d')
+                        updated_tracker = updated_tracker.astype(object).where(pd.notnull(updated_tracker), None)
+                        records = updated_tracker.to_dict(orient="records")
+                        for start in range(0, len(records), TRACKER_UPSERT_CHUNK_SIZE):
+                            conn.client.table("tracker").upsert(
+                                records[start:start + TRACKER_UPSERT_CHUNK_SIZE],
+                                on_conflict="job_id,user_id"
+                            ).execute()
+                        st.session_state.dirty_job_ids = set()
+                        # The next full rerun must read the saved rows, not the cached ones
+                        load_tracker.clear()
+                        st.success("Your application progress has been saved to Supabase! 🚀")
+                        st.balloons()
+                else:
+                    st.warning("Please log in to save your progress.")
 
-        if st.button("Save My Progress to Supabase"):
-            current_user_id = conn.auth.get_session().user.id if conn.auth.get_session() else None
-            if current_user_id:
-                updated_tracker = st.session_state.df_editor_state[["job_id", "status", "contact_date", "notes"]].copy()
-                updated_tracker.dropna(subset=['status'], inplace=True)
-                updated_tracker['user_id'] = current_user_id
-                if 'contact_date' in updated_tracker.columns:
-                    updated_tracker['contact_date'] = pd.to_datetime(updated_tracker['contact_date']).dt.strftime('%Y-%m-%d')
-                updated_tracker = updated_tracker.astype(object).where(pd.notnull(updated_tracker), None)
-                conn.client.table("tracker").upsert(
-                    updated_tracker.to_dict(orient="records"),
-                    on_conflict="job_id,user_id"
-                ).execute()
-                st.success("Your application progress has been saved to Supabase! 🚀")
-                st.balloons()
-            else:
-                st.warning("Please log in to save your progress.")
+        render_offers_editor(df_prepared.columns.tolist())
     
     elif st.session_state.page == 'Configure new search':
         st.title("⚙️ Configure new search")
@@ -896,7 +1128,9 @@ def main():
 
             if not st.session_state.superuser_access:
                 password = st.text_input("Enter Superuser Password to Enable Saving your Job Search", type="password")
-                if password == st.secrets.get("PASSWORD"):
+                # Constant-time comparison, and the secret is only read once something was typed
+                expected_password = st.secrets.get("PASSWORD") if password else None
+                if expected_password and hmac.compare_digest(password.encode(), str(expected_password).encode()):
                     st.session_state.superuser_access = True
                     st.rerun() # Rerun to activate the buttons in the form below
                 elif password: